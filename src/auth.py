@@ -5,6 +5,8 @@ import os
 import jwt
 from fastapi import Header, HTTPException
 
+from .token_cache import token_cache
+
 # Constants
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwt-secret-key-default-value")
 ALGORITHM = "HS256"
@@ -35,6 +37,9 @@ def validate_jwt_token(x_jwt_kwy: str = Header(None, alias="X-JWT-KWY")) -> dict
     """
     Validate and decode JWT token from request headers.
 
+    Successfully verified payloads are cached until the token's ``exp`` so
+    repeat calls with the same token skip signature verification.
+
     Args:
         x_jwt_kwy: JWT token from X-JWT-KWY header
 
@@ -48,12 +53,17 @@ def validate_jwt_token(x_jwt_kwy: str = Header(None, alias="X-JWT-KWY")) -> dict
     if not x_jwt_kwy:
         raise HTTPException(status_code=401, detail="JWT token required")
 
+    cached = token_cache.get(x_jwt_kwy)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(x_jwt_kwy, JWT_SECRET_KEY, algorithms=[ALGORITHM])
         if "transaction_id" not in payload:
             raise HTTPException(
                 status_code=401, detail="Invalid JWT: missing transaction_id"
             )
+        token_cache.put(x_jwt_kwy, payload)
         return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="JWT token expired")
@@ -1,26 +1,64 @@
+import json
 import os
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Iterable
 
 import jwt
-from fastapi import FastAPI, Header, Request
-from fastapi.responses import PlainTextResponse
-from pydantic import BaseModel, Field
+from fastapi import Body, FastAPI, Header, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 
 from .auth import validate_api_key, validate_jwt_token
+from .token_pool import TokenPool
+
+# Constants
+JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwt-secret-key-default-value")
+ALGORITHM = "HS256"
+TOKEN_EXPIRY_HOURS = 1
+TOKEN_BATCH_MAX = int(os.getenv("TOKEN_BATCH_MAX", "1000"))
+DEVOPS_BATCH_MAX = int(os.getenv("DEVOPS_BATCH_MAX", "1000"))
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def mint_tokens(count: int) -> list[str]:
+    """
+    Sign ``count`` JWT tokens, each with its own unique transaction_id.
+
+    The issue and expiry timestamps are computed once and shared by the batch.
+    """
+    now = datetime.now(timezone.utc)
+    exp = now + timedelta(hours=TOKEN_EXPIRY_HOURS)
+    return [
+        jwt.encode(
+            {"transaction_id": str(uuid.uuid4()), "exp": exp, "iat": now},
+            JWT_SECRET_KEY,
+            algorithm=ALGORITHM,
+        )
+        for _ in range(count)
+    ]
+
+
+token_pool = TokenPool(mint_tokens)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    token_pool.start()
+    yield
+    await token_pool.stop()
+
 
 # Application configuration
 app = FastAPI(
     title="DevOps Microservice",
     version="1.0.1",
     description="A secure microservice for DevOps operations with JWT authentication",
+    lifespan=lifespan,
 )
 
-# Constants
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwt-secret-key-default-value")
-ALGORITHM = "HS256"
-TOKEN_EXPIRY_HOURS = 1
-
 
 class DevOpsMessage(BaseModel):
     """Request model for DevOps endpoint"""
@@ -56,6 +94,10 @@ class TokenResponse(BaseModel):
     jwt: str
 
 
+class TokenBatchResponse(BaseModel):
+    jwts: list[str]
+
+
 @app.post(
     "/DevOps",
     response_model=DevOpsResponse,
@@ -95,9 +137,155 @@ async def devops_endpoint(
     validate_api_key(api_key)
     validate_jwt_token(jwt_token)
 
+    return process_message(message)
+
+
+def process_message(message: DevOpsMessage) -> DevOpsResponse:
+    """Handle a single validated DevOps message."""
     return DevOpsResponse(message=f"Hello {message.to} your message will be send")
 
 
+def _item_result(index: int, raw: Any) -> bytes:
+    """Validate and process one batch item, returning its NDJSON result line."""
+    try:
+        if isinstance(raw, (str, bytes)):
+            message = DevOpsMessage.model_validate_json(raw)
+        else:
+            message = DevOpsMessage.model_validate(raw)
+    except ValidationError as exc:
+        result = {
+            "index": index,
+            "status": 422,
+            "detail": jsonable_encoder(exc.errors(include_url=False)),
+        }
+    else:
+        result = {
+            "index": index,
+            "status": 200,
+            "message": process_message(message).message,
+        }
+    return json.dumps(result, separators=(",", ":")).encode() + b"\n"
+
+
+def _iter_batch_results(items: Iterable[Any]) -> Iterable[bytes]:
+    for index, raw in enumerate(items):
+        yield _item_result(index, raw)
+
+
+async def _iter_ndjson_results(body: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Answer each NDJSON line as soon as it has been received."""
+    index = 0
+    pending = b""
+    async for chunk in body:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _item_result(index, line)
+                index += 1
+    if pending.strip():
+        yield _item_result(index, pending)
+
+
+_batch_responses = {
+    200: {
+        "description": "One NDJSON result line per submitted message, in order",
+        "content": {
+            NDJSON_MEDIA_TYPE: {
+                "example": '{"index":0,"status":200,'
+                '"message":"Hello Juan Perez your message will be send"}'
+            }
+        },
+    },
+    401: {"description": "Authentication failed - Invalid API key or JWT token"},
+}
+
+
+@app.post(
+    "/DevOps/batch",
+    response_class=StreamingResponse,
+    summary="Send DevOps messages in bulk",
+    description="Processes a JSON array of DevOps messages with a single "
+    "authentication check and streams one NDJSON result per message",
+    responses={
+        **_batch_responses,
+        413: {"description": "Batch exceeds the maximum number of messages"},
+    },
+)
+async def devops_batch_endpoint(
+    messages: list[Any] = Body(..., description="JSON array of DevOps messages"),
+    api_key: str = Header(
+        ...,
+        alias="X-Parse-REST-API-Key",
+        description="API Key: 2f5ae96c-b558-4c7b-a590-a501ae1c3f6c",
+    ),
+    jwt_token: str = Header(
+        ..., alias="X-JWT-KWY", description="JWT token obtained from /generate-token"
+    ),
+):
+    """
+    Process a batch of DevOps messages.
+
+    Authentication is checked once for the whole batch. Each message is
+    validated on its own, so one invalid item yields a 422 result line
+    without failing the rest of the batch.
+    """
+    validate_api_key(api_key)
+    validate_jwt_token(jwt_token)
+
+    if len(messages) > DEVOPS_BATCH_MAX:
+        raise HTTPException(status_code=413, detail="Batch too large")
+
+    return StreamingResponse(
+        _iter_batch_results(messages), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+@app.post(
+    "/DevOps/stream",
+    response_class=StreamingResponse,
+    summary="Stream DevOps messages as NDJSON",
+    description="Processes an NDJSON body of DevOps messages line by line "
+    "and streams one NDJSON result per message",
+    responses=_batch_responses,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": {"type": "string"},
+                    "example": '{"message":"This is a test","to":"Juan Perez",'
+                    '"from":"Rita Asturia","timeToLifeSec":45}\n',
+                }
+            },
+        }
+    },
+)
+async def devops_stream_endpoint(
+    request: Request,
+    api_key: str = Header(
+        ...,
+        alias="X-Parse-REST-API-Key",
+        description="API Key: 2f5ae96c-b558-4c7b-a590-a501ae1c3f6c",
+    ),
+    jwt_token: str = Header(
+        ..., alias="X-JWT-KWY", description="JWT token obtained from /generate-token"
+    ),
+):
+    """
+    Process a stream of newline-delimited DevOps messages.
+
+    Authentication is checked once before the body is read. Lines are parsed
+    and answered as they arrive, so the body is never buffered in full.
+    """
+    validate_api_key(api_key)
+    validate_jwt_token(jwt_token)
+
+    return StreamingResponse(
+        _iter_ndjson_results(request.stream()), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
 @app.post(
     "/generate-token",
     response_model=TokenResponse,
@@ -122,18 +310,43 @@ async def generate_token():
     Returns a JWT token that can be used for authenticating requests to
     /DevOps endpoint.
     The token includes a unique transaction_id and expires in 1 hour.
+    When the token pool is enabled the token is taken from the pool.
     """
-    transaction_id = str(uuid.uuid4())
+    token = token_pool.pop() if token_pool.enabled else None
+    if token is None:
+        token = mint_tokens(1)[0]
 
-    payload = {
-        "transaction_id": transaction_id,
-        "exp": datetime.now(timezone.utc) + timedelta(hours=TOKEN_EXPIRY_HOURS),
-        "iat": datetime.now(timezone.utc),
-    }
+    return TokenResponse(jwt=token)
 
-    token = jwt.encode(payload, JWT_SECRET_KEY, algorithm=ALGORITHM)
 
-    return TokenResponse(jwt=token)
+@app.post(
+    "/generate-token/batch",
+    response_model=TokenBatchResponse,
+    summary="Generate JWT tokens in bulk",
+    description="Generates several JWT tokens, each with its own unique "
+    "transaction ID, in a single response",
+    responses={
+        200: {
+            "description": "JWT tokens generated successfully",
+            "content": {
+                "application/json": {
+                    "example": {"jwts": ["eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9..."]}
+                }
+            },
+        }
+    },
+)
+async def generate_token_batch(
+    count: int = Query(
+        10, ge=1, le=TOKEN_BATCH_MAX, description="Number of tokens to generate"
+    ),
+):
+    """
+    Generate ``count`` JWT tokens in one round trip.
+
+    Every token carries a unique transaction_id and expires in 1 hour.
+    """
+    return TokenBatchResponse(jwts=mint_tokens(count))
 
 
 @app.get(
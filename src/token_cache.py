@@ -0,0 +1,110 @@
+"""Bounded cache of already-verified JWT payloads for the DevOps microservice."""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Constants
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+TOKEN_CACHE_TTL_SEC = float(os.getenv("TOKEN_CACHE_TTL_SEC", "300"))
+
+
+class VerifiedTokenCache:
+    """
+    LRU cache mapping a token digest to its verified payload.
+
+    Entries expire at the earlier of the cache TTL and the token's own ``exp``
+    claim, so a cached token is never accepted after it would fail
+    ``jwt.decode``. Only successfully verified tokens are stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = TOKEN_CACHE_MAX_ENTRIES,
+        ttl_sec: float = TOKEN_CACHE_TTL_SEC,
+    ):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        """
+        Return the cached payload for a token, or None on a miss.
+
+        Args:
+            token: Raw JWT string
+
+        Returns:
+            dict | None: A copy of the verified payload if cached and unexpired
+        """
+        key = self._digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, payload = entry
+            if now >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return dict(payload)
+
+    def put(self, token: str, payload: dict) -> None:
+        """
+        Store a verified payload, bounded by the token's ``exp`` claim.
+
+        Args:
+            token: Raw JWT string
+            payload: Payload returned by ``jwt.decode``
+        """
+        if self.max_entries <= 0:
+            return
+        expires_at = time.time() + self.ttl_sec
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        key = self._digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return current size and hit/miss/eviction counters."""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_cache = VerifiedTokenCache()
@@ -0,0 +1,125 @@
+"""Background pool of pre-signed JWT tokens for the DevOps microservice."""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Callable
+
+# Constants
+TOKEN_POOL_SIZE = int(os.getenv("TOKEN_POOL_SIZE", "0"))
+TOKEN_POOL_MAX_AGE_SEC = float(os.getenv("TOKEN_POOL_MAX_AGE_SEC", "300"))
+TOKEN_POOL_REFILL_INTERVAL_SEC = float(
+    os.getenv("TOKEN_POOL_REFILL_INTERVAL_SEC", "1")
+)
+TOKEN_POOL_REFILL_CHUNK = 64
+
+
+class TokenPool:
+    """
+    Keeps freshly signed tokens ready so single-token requests become a pop.
+
+    Tokens are discarded once they are older than ``max_age_sec``, long before
+    they approach their own expiry. A background task tops the pool up every
+    ``refill_interval_sec``; callers fall back to minting when it is empty.
+    """
+
+    def __init__(
+        self,
+        mint: Callable[[int], list[str]],
+        size: int = TOKEN_POOL_SIZE,
+        max_age_sec: float = TOKEN_POOL_MAX_AGE_SEC,
+        refill_interval_sec: float = TOKEN_POOL_REFILL_INTERVAL_SEC,
+    ):
+        self.mint = mint
+        self.size = size
+        self.max_age_sec = max_age_sec
+        self.refill_interval_sec = refill_interval_sec
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self._tokens: deque[tuple[float, str]] = deque()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def pop(self) -> str | None:
+        """
+        Take a fresh token from the pool.
+
+        Returns:
+            str | None: A pre-signed token, or None if the pool is empty
+        """
+        deadline = time.monotonic() - self.max_age_sec
+        while self._tokens:
+            minted_at, token = self._tokens.popleft()
+            if minted_at > deadline:
+                self.hits += 1
+                return token
+            self.discarded += 1
+        self.misses += 1
+        return None
+
+    def discard_stale(self) -> None:
+        """Drop tokens older than ``max_age_sec`` from the front of the pool."""
+        deadline = time.monotonic() - self.max_age_sec
+        while self._tokens and self._tokens[0][0] <= deadline:
+            self._tokens.popleft()
+            self.discarded += 1
+
+    def refill(self, limit: int | None = None) -> int:
+        """
+        Top the pool up towards ``size`` tokens.
+
+        Args:
+            limit: Maximum number of tokens to mint in this call
+
+        Returns:
+            int: Number of tokens minted
+        """
+        self.discard_stale()
+        missing = self.size - len(self._tokens)
+        if limit is not None:
+            missing = min(missing, limit)
+        if missing <= 0:
+            return 0
+        minted_at = time.monotonic()
+        self._tokens.extend((minted_at, token) for token in self.mint(missing))
+        return missing
+
+    async def _run(self) -> None:
+        while True:
+            while self.refill(TOKEN_POOL_REFILL_CHUNK):
+                await asyncio.sleep(0)
+            await asyncio.sleep(self.refill_interval_sec)
+
+    def start(self) -> None:
+        """Start the background refill task if the pool is enabled."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background refill task and drop pooled tokens."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._tokens.clear()
+
+    def stats(self) -> dict:
+        """Return current pool size and hit/miss/discard counters."""
+        return {
+            "size": len(self._tokens),
+            "target_size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+        }
+
+    def __len__(self) -> int:
+        return len(self._tokens)
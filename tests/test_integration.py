@@ -1,5 +1,9 @@
 """Integration tests for the DevOps microservice endpoints."""
 
+import json
+
+from src import main
+
 
 class TestGenerateTokenEndpoint:
     """Test the /generate-token endpoint."""
@@ -39,6 +43,67 @@ class TestGenerateTokenEndpoint:
 
         assert token1 != token2  # Tokens should be unique
 
+    def test_generate_token_uses_pool_when_enabled(self, client, monkeypatch):
+        """Test that single-token requests pop from the token pool."""
+        from src.main import token_pool
+
+        monkeypatch.setattr(token_pool, "size", 2)
+        token_pool.refill()
+        pooled = [token for _, token in token_pool._tokens]
+
+        response = client.post("/generate-token")
+
+        assert response.status_code == 200
+        assert response.json()["jwt"] == pooled[0]
+        assert len(token_pool) == 1
+        token_pool._tokens.clear()
+
+
+class TestGenerateTokenBatchEndpoint:
+    """Test the /generate-token/batch endpoint."""
+
+    def test_generate_token_batch_success(self, client):
+        """Test bulk token generation."""
+        response = client.post("/generate-token/batch?count=5")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data.keys()) == ["jwts"]
+        assert len(data["jwts"]) == 5
+        assert len(set(data["jwts"])) == 5
+        assert all(token.count(".") == 2 for token in data["jwts"])
+
+    def test_generate_token_batch_unique_transaction_ids(self, client):
+        """Test that every token in a batch has its own transaction_id."""
+        from src.auth import validate_jwt_token
+
+        response = client.post("/generate-token/batch?count=3")
+        ids = {validate_jwt_token(t)["transaction_id"] for t in response.json()["jwts"]}
+
+        assert len(ids) == 3
+
+    def test_generate_token_batch_default_count(self, client):
+        """Test the default batch size."""
+        response = client.post("/generate-token/batch")
+
+        assert response.status_code == 200
+        assert len(response.json()["jwts"]) == 10
+
+    def test_generate_token_batch_count_out_of_range(self, client):
+        """Test that out-of-range counts are rejected."""
+        from src.main import TOKEN_BATCH_MAX
+
+        assert client.post("/generate-token/batch?count=0").status_code == 422
+        response = client.post(f"/generate-token/batch?count={TOKEN_BATCH_MAX + 1}")
+        assert response.status_code == 422
+
+    def test_get_generate_token_batch_endpoint(self, client):
+        """Test GET request to /generate-token/batch endpoint."""
+        response = client.get("/generate-token/batch")
+
+        assert response.status_code == 404
+        assert response.text == "ERROR"
+
 
 class TestDevOpsEndpoint:
     """Test the /DevOps endpoint."""
@@ -145,6 +210,144 @@ class TestDevOpsEndpoint:
         assert response.status_code == 422  # Validation error
 
 
+class TestDevOpsBatchEndpoint:
+    """Test the /DevOps/batch endpoint."""
+
+    def test_devops_batch_success(self, client, valid_headers, valid_devops_message):
+        """Test a batch of valid messages."""
+        second = {**valid_devops_message, "to": "Rita Asturia"}
+        response = client.post(
+            "/DevOps/batch", json=[valid_devops_message, second], headers=valid_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [
+            {
+                "index": 0,
+                "status": 200,
+                "message": "Hello Juan Perez your message will be send",
+            },
+            {
+                "index": 1,
+                "status": 200,
+                "message": "Hello Rita Asturia your message will be send",
+            },
+        ]
+
+    def test_devops_batch_per_item_validation_errors(
+        self, client, valid_headers, valid_devops_message
+    ):
+        """Test that invalid items fail individually."""
+        response = client.post(
+            "/DevOps/batch",
+            json=[{"message": "test"}, valid_devops_message, "not-an-object"],
+            headers=valid_headers,
+        )
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["status"] for line in lines] == [422, 200, 422]
+        missing = {error["loc"][-1] for error in lines[0]["detail"]}
+        assert {"to", "timeToLifeSec"} <= missing
+
+    def test_devops_batch_validates_auth_once(
+        self, client, valid_headers, valid_devops_message, mocker
+    ):
+        """Test that auth is checked once per batch, not per item."""
+        spy = mocker.spy(main, "validate_jwt_token")
+
+        client.post(
+            "/DevOps/batch", json=[valid_devops_message] * 5, headers=valid_headers
+        )
+
+        assert spy.call_count == 1
+
+    def test_devops_batch_invalid_api_key(
+        self, client, valid_jwt_token, valid_devops_message, invalid_api_key
+    ):
+        """Test batch endpoint with invalid API key."""
+        headers = {
+            "X-Parse-REST-API-Key": invalid_api_key,
+            "X-JWT-KWY": valid_jwt_token,
+        }
+        response = client.post(
+            "/DevOps/batch", json=[valid_devops_message], headers=headers
+        )
+
+        assert response.status_code == 401
+        assert "Invalid API Key" in response.json()["detail"]
+
+    def test_devops_batch_too_large(
+        self, client, valid_headers, valid_devops_message, monkeypatch
+    ):
+        """Test that oversized batches are rejected."""
+        monkeypatch.setattr(main, "DEVOPS_BATCH_MAX", 2)
+        response = client.post(
+            "/DevOps/batch", json=[valid_devops_message] * 3, headers=valid_headers
+        )
+
+        assert response.status_code == 413
+
+    def test_devops_batch_requires_array(self, client, valid_headers):
+        """Test that a non-array body is rejected."""
+        response = client.post(
+            "/DevOps/batch", json={"message": "test"}, headers=valid_headers
+        )
+
+        assert response.status_code == 422
+
+
+class TestDevOpsStreamEndpoint:
+    """Test the /DevOps/stream endpoint."""
+
+    def test_devops_stream_success(self, client, valid_headers, valid_devops_message):
+        """Test an NDJSON stream sent in arbitrary chunks."""
+        body = (json.dumps(valid_devops_message) + "\n").encode() * 3
+
+        def chunks():
+            for start in range(0, len(body), 7):
+                yield body[start : start + 7]
+
+        response = client.post("/DevOps/stream", content=chunks(), headers=valid_headers)
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["index"] for line in lines] == [0, 1, 2]
+        assert all(line["status"] == 200 for line in lines)
+
+    def test_devops_stream_invalid_lines(
+        self, client, valid_headers, valid_devops_message
+    ):
+        """Test malformed and invalid lines produce per-item errors."""
+        body = "\n".join(
+            ["{not json", "", json.dumps({"message": "x"}), json.dumps(valid_devops_message)]
+        )
+
+        response = client.post("/DevOps/stream", content=body, headers=valid_headers)
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["status"] for line in lines] == [422, 422, 200]
+        assert lines[0]["detail"][0]["type"] == "json_invalid"
+        assert lines[2]["index"] == 2
+
+    def test_devops_stream_expired_jwt(
+        self, client, valid_api_key, expired_jwt_token, valid_devops_message
+    ):
+        """Test stream endpoint with expired JWT token."""
+        headers = {
+            "X-Parse-REST-API-Key": valid_api_key,
+            "X-JWT-KWY": expired_jwt_token,
+        }
+        response = client.post(
+            "/DevOps/stream", content=json.dumps(valid_devops_message), headers=headers
+        )
+
+        assert response.status_code == 401
+        assert "JWT token expired" in response.json()["detail"]
+
+
 class TestInvalidHTTPMethods:
     """Test invalid HTTP methods on endpoints."""
 
@@ -154,3 +154,200 @@ class TestResponseFormat:
         # Test alias works for input
         message_with_alias = message.model_dump(by_alias=True)
         assert "from" in message_with_alias  # Alias should appear in aliased output
+
+
+class TestVerifiedTokenCache:
+    """Test the verified-token cache in front of JWT validation."""
+
+    def test_repeat_validation_hits_cache(self, valid_jwt_token, mocker):
+        """Test that a second validation skips jwt.decode."""
+        from src.token_cache import token_cache
+
+        first = validate_jwt_token(valid_jwt_token)
+        decode = mocker.patch("src.auth.jwt.decode")
+        hits_before = token_cache.hits
+
+        second = validate_jwt_token(valid_jwt_token)
+
+        decode.assert_not_called()
+        assert second == first
+        assert token_cache.hits == hits_before + 1
+
+    def test_cached_payload_is_a_copy(self, valid_jwt_token):
+        """Test that mutating a returned payload does not poison the cache."""
+        payload = validate_jwt_token(valid_jwt_token)
+        payload["transaction_id"] = "tampered"
+
+        assert validate_jwt_token(valid_jwt_token)["transaction_id"] != "tampered"
+
+    def test_entry_expires_with_token_exp(self, mocker):
+        """Test that entries never outlive the token's exp claim."""
+        from src.token_cache import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(max_entries=10, ttl_sec=3600)
+        clock = mocker.patch("src.token_cache.time.time", return_value=1000.0)
+        cache.put("token", {"transaction_id": "abc", "exp": 1010})
+
+        clock.return_value = 1009.0
+        assert cache.get("token") is not None
+        clock.return_value = 1010.0
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_entry_expires_with_cache_ttl(self, mocker):
+        """Test that entries expire after the cache TTL when exp is later."""
+        from src.token_cache import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(max_entries=10, ttl_sec=5)
+        clock = mocker.patch("src.token_cache.time.time", return_value=1000.0)
+        cache.put("token", {"transaction_id": "abc", "exp": 5000})
+
+        clock.return_value = 1005.0
+        assert cache.get("token") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at capacity."""
+        from src.token_cache import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(max_entries=2, ttl_sec=60)
+        cache.put("a", {"transaction_id": "a"})
+        cache.put("b", {"transaction_id": "b"})
+        cache.get("a")
+        cache.put("c", {"transaction_id": "c"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_stats_and_clear(self):
+        """Test hit/miss counters and clearing the cache."""
+        from src.token_cache import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(max_entries=2, ttl_sec=60)
+        cache.get("missing")
+        cache.put("a", {"transaction_id": "a"})
+        cache.get("a")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+        cache.clear()
+        assert cache.stats() == {
+            "size": 0,
+            "max_entries": 2,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def test_disabled_cache_stores_nothing(self):
+        """Test that a zero-sized cache never stores entries."""
+        from src.token_cache import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(max_entries=0)
+        cache.put("a", {"transaction_id": "a"})
+
+        assert len(cache) == 0
+
+    def test_failed_tokens_are_not_cached(self, expired_jwt_token):
+        """Test that rejected tokens are never stored."""
+        from src.token_cache import token_cache
+
+        size_before = len(token_cache)
+        with pytest.raises(HTTPException):
+            validate_jwt_token(expired_jwt_token)
+
+        assert len(token_cache) == size_before
+
+
+class TestTokenPool:
+    """Test the pre-signed token pool."""
+
+    @staticmethod
+    def _mint(count):
+        return [f"token-{i}" for i in range(count)]
+
+    def test_refill_and_pop(self):
+        """Test that refill tops the pool up and pop drains it in order."""
+        from src.token_pool import TokenPool
+
+        pool = TokenPool(self._mint, size=3)
+        assert pool.refill() == 3
+        assert pool.refill() == 0
+
+        assert pool.pop() == "token-0"
+        assert len(pool) == 2
+        assert pool.stats()["hits"] == 1
+
+    def test_refill_respects_limit(self):
+        """Test that refill mints at most ``limit`` tokens per call."""
+        from src.token_pool import TokenPool
+
+        pool = TokenPool(self._mint, size=5)
+
+        assert pool.refill(limit=2) == 2
+        assert len(pool) == 2
+
+    def test_pop_empty_pool_is_a_miss(self):
+        """Test that an empty pool returns None."""
+        from src.token_pool import TokenPool
+
+        pool = TokenPool(self._mint, size=1)
+
+        assert pool.pop() is None
+        assert pool.stats()["misses"] == 1
+
+    def test_stale_tokens_are_discarded(self, mocker):
+        """Test that tokens older than max_age_sec are never handed out."""
+        from src.token_pool import TokenPool
+
+        clock = mocker.patch("src.token_pool.time.monotonic", return_value=100.0)
+        pool = TokenPool(self._mint, size=2, max_age_sec=10)
+        pool.refill()
+
+        clock.return_value = 111.0
+        assert pool.pop() is None
+        assert pool.stats()["discarded"] == 2
+
+        pool.refill()
+        clock.return_value = 122.0
+        pool.discard_stale()
+        assert len(pool) == 0
+
+    def test_disabled_pool(self):
+        """Test that a zero-sized pool is disabled and never starts."""
+        from src.token_pool import TokenPool
+
+        pool = TokenPool(self._mint, size=0)
+        pool.start()
+
+        assert not pool.enabled
+        assert pool._task is None
+
+    async def test_background_refill(self):
+        """Test that the background task fills the pool and stop clears it."""
+        import asyncio
+
+        from src.token_pool import TokenPool
+
+        pool = TokenPool(self._mint, size=4, refill_interval_sec=0.01)
+        pool.start()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert len(pool) == 4
+
+        await pool.stop()
+        assert len(pool) == 0
+        assert pool._task is None
+
+    def test_mint_tokens_are_valid(self):
+        """Test that bulk-minted tokens pass validation."""
+        from src.main import mint_tokens
+
+        tokens = mint_tokens(2)
+
+        assert len(tokens) == 2
+        assert all("transaction_id" in validate_jwt_token(t) for t in tokens)